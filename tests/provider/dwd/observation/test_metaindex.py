@@ -2,6 +2,9 @@
 # Copyright (c) 2018-2021, earthobservations developers.
 # Distributed under the MIT License. See LICENSE for more info.
 """ tests for file index creation """
+from io import BytesIO
+
+import pandas as pd
 import pytest
 
 from wetterdienst.metadata.columns import Columns
@@ -9,10 +12,98 @@ from wetterdienst.metadata.period import Period
 from wetterdienst.metadata.resolution import Resolution
 from wetterdienst.provider.dwd.observation import DwdObservationDataset
 from wetterdienst.provider.dwd.observation.metaindex import (
+    METADATA_FIXED_COLUMN_WIDTH,
+    _parse_meta_file,
     create_meta_index_for_climate_observations,
 )
 
 
+def _make_line(*fields: str) -> str:
+    line = ""
+
+    for field, (start, stop) in zip(fields, METADATA_FIXED_COLUMN_WIDTH):
+        line = line.ljust(start) + field
+
+    return line.rstrip()
+
+
+METADATA_FILE = (
+    "Stations_id von_datum bis_datum Stationshoehe geoBreite geoLaenge "
+    "Stationsname Bundesland\n"
+    "----------- --------- --------- ------------- --------- --------- "
+    "------------ ----------\n"
+    + _make_line(
+        "00001",
+        "18910101",
+        "19860630",
+        "478",
+        "47.8413",
+        "8.8493",
+        "Aach",
+        "Baden-Württemberg",
+    )
+    + "\n"
+    + _make_line(
+        "00044",
+        "19690101",
+        "20210314",
+        "44",
+        "52.9336",
+        "8.2370",
+        "Großenkneten",
+        "Niedersachsen",
+    )
+    + "\n"
+    + _make_line("00161", "19310101", "19860630")
+    + "\n"
+).encode("ISO-8859-1")
+
+
+def _parse_meta_file_with_pandas(file: BytesIO) -> pd.DataFrame:
+    """ Reference implementation based on pandas.read_fwf """
+    meta_index = pd.read_fwf(
+        filepath_or_buffer=file,
+        colspecs=METADATA_FIXED_COLUMN_WIDTH,
+        skiprows=[1],
+        dtype=str,
+        encoding="ISO-8859-1",
+    )
+
+    # Fix column names, as header is not aligned to fixed column widths
+    meta_index.columns = "".join(
+        [column for column in meta_index.columns if "unnamed" not in column.lower()]
+    ).split(" ")
+
+    return meta_index
+
+
+@pytest.mark.parametrize("line_terminator", [b"\n", b"\r\n"])
+def test_parse_meta_file(line_terminator):
+
+    payload = METADATA_FILE.replace(b"\n", line_terminator)
+
+    meta_index = _parse_meta_file(BytesIO(payload))
+
+    expected = _parse_meta_file_with_pandas(BytesIO(payload))
+
+    assert meta_index.columns.tolist() == [
+        "Stations_id",
+        "von_datum",
+        "bis_datum",
+        "Stationshoehe",
+        "geoBreite",
+        "geoLaenge",
+        "Stationsname",
+        "Bundesland",
+    ]
+
+    # Non ASCII station names are decoded and empty fields yield NaN
+    assert meta_index["Stationsname"].tolist()[:2] == ["Aach", "Großenkneten"]
+    assert meta_index["Bundesland"].isna().tolist() == [False, False, True]
+
+    pd.testing.assert_frame_equal(meta_index, expected)
+
+
 @pytest.mark.remote
 def test_meta_index_creation_success():
 
@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2018-2021, earthobservations developers.
+# Distributed under the MIT License. See LICENSE for more info.
+import pandas as pd
+
+from wetterdienst.util.cache import cache_dataframe, payload_cache_twelve_hours
+
+
+def test_cache_dataframe_round_trip():
+
+    calls = []
+
+    @cache_dataframe(payload_cache_twelve_hours)
+    def create_frame(tag: str) -> pd.DataFrame:
+        calls.append(tag)
+        return pd.DataFrame(
+            {
+                "station_id": ["01048", "00011"],
+                "name": ["Dresden-Klotzsche", None],
+                "height": [228.0, 680.0],
+            }
+        )
+
+    create_frame.invalidate("station_data")
+
+    df = create_frame("station_data")
+    df_cached = create_frame("station_data")
+
+    # The function itself ran only once and both calls yield equal frames
+    assert calls == ["station_data"]
+    pd.testing.assert_frame_equal(df, df_cached)
+
+    # Mutating one result does not leak into the cache
+    df_cached["height"] = 0
+
+    pd.testing.assert_frame_equal(create_frame("station_data"), df)
+
+    create_frame.invalidate("station_data")
+
+    create_frame("station_data")
+
+    assert calls == ["station_data", "station_data"]
+
+
+def test_cache_dataframe_legacy_payload():
+
+    df = pd.DataFrame({"station_id": ["01048"]})
+
+    @cache_dataframe(payload_cache_twelve_hours)
+    def create_frame() -> pd.DataFrame:
+        return df
+
+    create_frame.invalidate()
+
+    # Entries written before the feather serialization hold the DataFrame
+    # itself and are passed through as is
+    payload_cache_twelve_hours.set("tests.util.test_cache:create_frame|", df)
+
+    pd.testing.assert_frame_equal(create_frame(), df)
+
+    create_frame.invalidate()
@@ -209,6 +209,11 @@ class ScalarRequestCore(Core):
                 .tolist()
             )
 
+    # Cache for resolved parameters, keyed by request class, dataset accessor and
+    # the raw parameter/dataset pair, so that repeated requests resolve each
+    # parameter with one dict lookup instead of walking the enumerations again
+    _parameter_resolution_cache: dict = {}
+
     def _parse_parameter(
         self, parameter: List[Union[str, Enum]]
     ) -> List[Tuple[Enum, Enum]]:
@@ -242,51 +247,76 @@ class ScalarRequestCore(Core):
             except (ValueError, TypeError):
                 parameter, dataset = parameter, parameter
 
-            # Prefix return values
-            parameter_, dataset_ = None, None
+            cache_key = (type(self), self._dataset_accessor, parameter, dataset)
 
-            # Try to parse dataset
             try:
-                dataset_ = parse_enumeration_from_template(dataset, self._dataset_base)
-            except InvalidEnumeration:
-                pass
+                resolved = self._parameter_resolution_cache.get(cache_key)
+            except TypeError:
+                # Unhashable parameter, resolve without caching
+                cache_key, resolved = None, None
 
-            if parameter == dataset and dataset_:
-                parameters.append((dataset_, dataset_))
-                continue
+            if resolved is None:
+                resolved = self._resolve_parameter(parameter, dataset)
 
-            try:
-                # First parse parameter
-                parameter_ = parse_enumeration_from_template(
-                    parameter, self._parameter_base[self._dataset_accessor]
-                )
-            except (InvalidEnumeration, TypeError):
-                pass
+                if resolved and cache_key:
+                    self._parameter_resolution_cache[cache_key] = resolved
+
+            if resolved:
+                parameters.append(resolved)
             else:
-                if self._unique_dataset:
-                    # If unique dataset the dataset is given by the accessor
-                    # and the parameter is not a subset of a dataset
-                    dataset_ = self._dataset_tree[self._dataset_accessor]
-                elif not dataset_:
-                    # If there's multiple datasets the mapping defines which one
-                    # is taken for the given parameter
-                    dataset_ = self._parameter_to_dataset_mapping[self.resolution][
-                        parameter_
-                    ]
-
-                if not self._unique_dataset:
-                    # Parameter then has to be taken from the datasets definition
-                    parameter_ = self._dataset_tree[self._dataset_accessor][
-                        dataset_.name
-                    ][parameter_.name]
-
-                parameters.append((parameter_, dataset_))
-
-            if not parameter_:
                 log.info(f"parameter {parameter} could not be parsed from ({enums})")
 
         return parameters
 
+    def _resolve_parameter(
+        self, parameter: Union[str, Enum], dataset: Union[str, Enum]
+    ) -> Optional[Tuple[Enum, Enum]]:
+        """
+        Method to resolve a single parameter/dataset pair to the respective
+        enumerations.
+
+        :param parameter: parameter as string or enumeration
+        :param dataset: dataset as string or enumeration
+        :return: tuple of parameter and dataset enumeration or None if the
+            parameter could not be resolved
+        """
+        # Prefix return values
+        parameter_, dataset_ = None, None
+
+        # Try to parse dataset
+        try:
+            dataset_ = parse_enumeration_from_template(dataset, self._dataset_base)
+        except InvalidEnumeration:
+            pass
+
+        if parameter == dataset and dataset_:
+            return dataset_, dataset_
+
+        try:
+            # First parse parameter
+            parameter_ = parse_enumeration_from_template(
+                parameter, self._parameter_base[self._dataset_accessor]
+            )
+        except (InvalidEnumeration, TypeError):
+            return None
+
+        if self._unique_dataset:
+            # If unique dataset the dataset is given by the accessor
+            # and the parameter is not a subset of a dataset
+            dataset_ = self._dataset_tree[self._dataset_accessor]
+        elif not dataset_:
+            # If there's multiple datasets the mapping defines which one
+            # is taken for the given parameter
+            dataset_ = self._parameter_to_dataset_mapping[self.resolution][parameter_]
+
+        if not self._unique_dataset:
+            # Parameter then has to be taken from the datasets definition
+            parameter_ = self._dataset_tree[self._dataset_accessor][dataset_.name][
+                parameter_.name
+            ]
+
+        return parameter_, dataset_
+
     @staticmethod
     def _parse_station_id(series: pd.Series) -> pd.Series:
         """
@@ -784,14 +814,12 @@ class ScalarRequestCore(Core):
         if bottom >= top:
             raise ValueError("bbox bottom border should be smaller then top")
 
-        lat_interval = pd.Interval(bottom, top, closed="both")
-        lon_interval = pd.Interval(left, right, closed="both")
-
         df = self.all().df
 
         df = df[
-            df[Columns.LATITUDE.value].apply(lambda x: x in lat_interval)
-            & df[Columns.LONGITUDE.value].apply(lambda x: x in lon_interval)
+            # Default inclusion of both interval ends matches the bbox borders
+            df[Columns.LATITUDE.value].between(bottom, top)
+            & df[Columns.LONGITUDE.value].between(left, right)
         ]
 
         result = StationsResult(stations=self, df=df.reset_index(drop=True))
@@ -59,7 +59,7 @@ class KMLReader:
             unit_divisor=1024,
             file=tqdm_out,
         ) as bar:
-            for data in read_in_chunks(response, chunk_size=1024):
+            for data in read_in_chunks(response):
                 size = buffer.write(data)
                 bar.update(size)
 
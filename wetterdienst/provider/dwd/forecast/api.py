@@ -337,6 +337,16 @@ class DwdMosmixRequest(ScalarRequestCore):
         (72, 76),
     ]
 
+    # Fields of interest within the station catalog, by column position
+    _catalog_columns = {
+        2: Columns.STATION_ID.value,
+        3: Columns.ICAO_ID.value,
+        4: Columns.NAME.value,
+        5: Columns.LATITUDE.value,
+        6: Columns.LONGITUDE.value,
+        7: Columns.HEIGHT.value,
+    }
+
     _columns = [
         Columns.STATION_ID.value,
         Columns.ICAO_ID.value,
@@ -523,6 +533,9 @@ class DwdMosmixRequest(ScalarRequestCore):
         # TODO: Cache payload with FSSPEC
         payload = requests.get(self._url, headers={"User-Agent": ""})
 
+        # Assign column labels at parse time, so the fields of interest can be
+        # picked in one go instead of slicing and relabelling the DataFrame
+        # afterwards
         df = pd.read_fwf(
             StringIO(payload.text),
             skiprows=4,
@@ -531,23 +544,17 @@ class DwdMosmixRequest(ScalarRequestCore):
             na_values=["----"],
             header=None,
             dtype="str",
+            names=[
+                self._catalog_columns.get(position, position)
+                for position in range(len(self._colspecs))
+            ],
         )
 
-        df = df[
+        df = df.loc[
             (df.iloc[:, 0] != "=====")
             & (df.iloc[:, 0] != "TABLE")
-            & (df.iloc[:, 0] != "clu")
-        ]
-
-        df = df.iloc[:, [2, 3, 4, 5, 6, 7]]
-
-        df.columns = [
-            Columns.STATION_ID.value,
-            Columns.ICAO_ID.value,
-            Columns.NAME.value,
-            Columns.LATITUDE.value,
-            Columns.LONGITUDE.value,
-            Columns.HEIGHT.value,
+            & (df.iloc[:, 0] != "clu"),
+            list(self._catalog_columns.values()),
         ]
 
         # Convert coordinates from degree minutes to decimal degrees
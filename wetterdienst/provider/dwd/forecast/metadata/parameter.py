@@ -2,54 +2,74 @@
 # Copyright (c) 2018-2021, earthobservations developers.
 # Distributed under the MIT License. See LICENSE for more info.
 from enum import Enum
+from typing import Type
 
 from wetterdienst.util.parameter import DatasetTreeCore
 
+# Parameters of the small MOSMIX variant. It is a subset of the large variant,
+# so only the member names are listed here and the members themselves are
+# derived from the large enumeration instead of declaring the name/value pairs
+# a second time.
+_MOSMIX_SMALL_PARAMETERS = (
+    "TEMPERATURE_AIR_MEAN_200",
+    "TEMPERATURE_DEW_POINT_MEAN_200",
+    "TEMPERATURE_AIR_MAX_200",
+    "TEMPERATURE_AIR_MIN_200",
+    "WIND_DIRECTION",
+    "WIND_SPEED",
+    "WIND_GUST_MAX_LAST_1H",
+    "WIND_GUST_MAX_LAST_3H",
+    "WIND_GUST_MAX_LAST_12H",
+    "PRECIPITATION_HEIGHT_SIGNIFICANT_WEATHER_LAST_1H",
+    "PRECIPITATION_HEIGHT_SIGNIFICANT_WEATHER_LAST_3H",
+    "WATER_EQUIVALENT_SNOW_DEPTH_NEW_LAST_1H",
+    "WATER_EQUIVALENT_SNOW_DEPTH_NEW_LAST_3H",
+    "WEATHER_SIGNIFICANT",
+    "WEATHER_LAST_6H",
+    "CLOUD_COVER_TOTAL",
+    "CLOUD_COVER_EFFECTIVE",
+    "CLOUD_COVER_BELOW_500_FT",
+    "CLOUD_COVER_BELOW_1000_FT",
+    "CLOUD_COVER_BETWEEN_2_TO_7_KM",
+    "CLOUD_COVER_ABOVE_7_KM",
+    "PRESSURE_AIR_SITE_REDUCED",
+    "TEMPERATURE_AIR_MEAN_005",
+    "RADIATION_GLOBAL",
+    "VISIBILITY",
+    "SUNSHINE_DURATION",
+    "PROBABILITY_WIND_GUST_GE_25_KN_LAST_12H",
+    "PROBABILITY_WIND_GUST_GE_40_KN_LAST_12H",
+    "PROBABILITY_WIND_GUST_GE_55_KN_LAST_12H",
+    "PROBABILITY_FOG_LAST_1H",
+    "PROBABILITY_FOG_LAST_6H",
+    "PROBABILITY_FOG_LAST_12H",
+    "PROBABILITY_PRECIPITATION_HEIGHT_GT_0_0_MM_LAST_12H",
+    "PROBABILITY_PRECIPITATION_HEIGHT_GT_0_2_MM_LAST_6H",
+    "PROBABILITY_PRECIPITATION_HEIGHT_GT_0_2_MM_LAST_12H",
+    "PROBABILITY_PRECIPITATION_HEIGHT_GT_0_2_MM_LAST_24H",
+    "PROBABILITY_PRECIPITATION_HEIGHT_GT_1_0_MM_LAST_12H",
+    "PROBABILITY_PRECIPITATION_HEIGHT_GT_5_0_MM_LAST_6H",
+    "PROBABILITY_PRECIPITATION_HEIGHT_GT_5_0_MM_LAST_12H",
+    "PROBABILITY_PRECIPITATION_HEIGHT_GT_5_0_MM_LAST_24H",
+)
 
-class DwdMosmixParameter(DatasetTreeCore):
-    # https://opendata.dwd.de/weather/lib/MetElementDefinition.xml
-    class SMALL(Enum):
-        TEMPERATURE_AIR_MEAN_200 = "ttt"
-        TEMPERATURE_DEW_POINT_MEAN_200 = "td"
-        TEMPERATURE_AIR_MAX_200 = "tx"
-        TEMPERATURE_AIR_MIN_200 = "tn"
-        WIND_DIRECTION = "dd"
-        WIND_SPEED = "ff"
-        WIND_GUST_MAX_LAST_1H = "fx1"
-        WIND_GUST_MAX_LAST_3H = "fx3"
-        WIND_GUST_MAX_LAST_12H = "fxh"
-        PRECIPITATION_HEIGHT_SIGNIFICANT_WEATHER_LAST_1H = "rr1c"
-        PRECIPITATION_HEIGHT_SIGNIFICANT_WEATHER_LAST_3H = "rr3c"
-        WATER_EQUIVALENT_SNOW_DEPTH_NEW_LAST_1H = "rrs1c"
-        WATER_EQUIVALENT_SNOW_DEPTH_NEW_LAST_3H = "rrs3c"
-        WEATHER_SIGNIFICANT = "ww"
-        WEATHER_LAST_6H = "w1w2"
-        CLOUD_COVER_TOTAL = "n"
-        CLOUD_COVER_EFFECTIVE = "neff"
-        CLOUD_COVER_BELOW_500_FT = "n05"
-        CLOUD_COVER_BELOW_1000_FT = "nl"
-        CLOUD_COVER_BETWEEN_2_TO_7_KM = "nm"
-        CLOUD_COVER_ABOVE_7_KM = "nh"
-        PRESSURE_AIR_SITE_REDUCED = "pppp"
-        TEMPERATURE_AIR_MEAN_005 = "t5cm"
-        RADIATION_GLOBAL = "rad1h"
-        VISIBILITY = "vv"
-        SUNSHINE_DURATION = "sund1"
-        PROBABILITY_WIND_GUST_GE_25_KN_LAST_12H = "fxh25"
-        PROBABILITY_WIND_GUST_GE_40_KN_LAST_12H = "fxh40"
-        PROBABILITY_WIND_GUST_GE_55_KN_LAST_12H = "fxh55"
-        PROBABILITY_FOG_LAST_1H = "wwm"
-        PROBABILITY_FOG_LAST_6H = "wwm6"
-        PROBABILITY_FOG_LAST_12H = "wwmh"
-        PROBABILITY_PRECIPITATION_HEIGHT_GT_0_0_MM_LAST_12H = "rh00"
-        PROBABILITY_PRECIPITATION_HEIGHT_GT_0_2_MM_LAST_6H = "r602"
-        PROBABILITY_PRECIPITATION_HEIGHT_GT_0_2_MM_LAST_12H = "rh02"
-        PROBABILITY_PRECIPITATION_HEIGHT_GT_0_2_MM_LAST_24H = "rd02"
-        PROBABILITY_PRECIPITATION_HEIGHT_GT_1_0_MM_LAST_12H = "rh10"
-        PROBABILITY_PRECIPITATION_HEIGHT_GT_5_0_MM_LAST_6H = "r650"
-        PROBABILITY_PRECIPITATION_HEIGHT_GT_5_0_MM_LAST_12H = "rh50"
-        PROBABILITY_PRECIPITATION_HEIGHT_GT_5_0_MM_LAST_24H = "rd50"
 
+def _derive_small_parameters(large: Type[Enum]) -> Enum:
+    """
+    Derive the parameters of the small MOSMIX variant as a subset of the large
+    one, keeping the declaration order of the names.
+
+    :param large:   enumeration with the parameters of the large variant
+    :return:        enumeration with the parameters of the small variant
+    """
+    return Enum(
+        "SMALL",
+        [(name, large[name].value) for name in _MOSMIX_SMALL_PARAMETERS],
+        qualname="DwdMosmixParameter.SMALL",
+    )
+
+
+class DwdMosmixParameter(DatasetTreeCore):
     class LARGE(Enum):
         TEMPERATURE_AIR_MEAN_200 = "ttt"
         TEMPERATURE_DEW_POINT_MEAN_200 = "td"
@@ -173,3 +193,5 @@ class DwdMosmixParameter(DatasetTreeCore):
         WEATHER_SIGNIFICANT_OPTIONAL_LAST_6H = "wpc61"
         WEATHER_SIGNIFICANT_OPTIONAL_LAST_12H = "wpch1"
         WEATHER_SIGNIFICANT_OPTIONAL_LAST_24H = "wpcd1"
+
+    SMALL = _derive_small_parameters(LARGE)
@@ -20,6 +20,12 @@ from wetterdienst.provider.dwd.observation.metadata.parameter import (
     DwdObservationDatasetTree,
 )
 
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pa_csv
+except ImportError:  # pragma: no cover
+    pa = None
+
 log = logging.getLogger(__name__)
 
 # Parameter names used to create full 1 minute precipitation dataset wherever those
@@ -85,15 +91,11 @@ def _parse_climate_observations_data(
     """
     filename, file = filename_and_file
 
+    # prevent leading/trailing whitespace
+    payload = file.read().replace(b" ", b"")
+
     try:
-        df = pd.read_csv(
-            filepath_or_buffer=BytesIO(
-                file.read().replace(b" ", b"")
-            ),  # prevent leading/trailing whitespace
-            sep=STATION_DATA_SEP,
-            dtype="str",
-            na_values=NA_STRING,
-        )
+        df = _read_station_data(payload)
     except pd.errors.ParserError:
         log.warning(
             f"The file representing {filename} could not be parsed and is skipped."
@@ -103,6 +105,71 @@ def _parse_climate_observations_data(
         log.warning(f"The file representing {filename} is None and is skipped.")
         return pd.DataFrame()
 
+    return _transform_station_data(df, dataset, resolution, period)
+
+
+def _read_station_data(payload: bytes) -> pd.DataFrame:
+    """
+    Read the semicolon separated station data into a DataFrame of strings.
+    Uses pyarrow's multithreaded CSV reader if it is installed, with all
+    columns read as strings so that values keep their original representation.
+    Falls back to the slower pandas reader otherwise, which also translates
+    malformed payloads into the errors expected by the caller.
+
+    :param payload: raw station data payload
+    :return: pandas.DataFrame of strings with data from one station
+    """
+    if pa:
+        column_names = (
+            payload.split(b"\n", 1)[0]
+            .decode("ISO-8859-1")
+            .strip()
+            .split(STATION_DATA_SEP)
+        )
+
+        try:
+            table = pa_csv.read_csv(
+                BytesIO(payload),
+                parse_options=pa_csv.ParseOptions(delimiter=STATION_DATA_SEP),
+                convert_options=pa_csv.ConvertOptions(
+                    column_types={name: pa.string() for name in column_names},
+                    null_values=["", NA_STRING],
+                    strings_can_be_null=True,
+                ),
+            )
+        except pa.lib.ArrowInvalid:
+            # Re-read with pandas, which raises the errors handled by the
+            # caller for malformed payloads
+            pass
+        else:
+            return table.to_pandas()
+
+    return pd.read_csv(
+        filepath_or_buffer=BytesIO(payload),
+        sep=STATION_DATA_SEP,
+        dtype="str",
+        na_values=NA_STRING,
+    )
+
+
+def _transform_station_data(
+    df: pd.DataFrame,
+    dataset: DwdObservationDataset,
+    resolution: Resolution,
+    period: Period,
+) -> pd.DataFrame:
+    """
+    Apply the column and dataset specific transformations to freshly read
+    station data.
+
+    :param df: pandas.DataFrame with data from one station
+    :param dataset: enumeration of parameter used to correctly parse the date field
+    :param resolution: enumeration of time resolution used to correctly parse the
+        date field
+    :param period: enumeration of period of data
+    :return: pandas.DataFrame with transformed data
+    """
+
     # Column names contain spaces, so strip them away.
     df = df.rename(columns=str.strip)
 
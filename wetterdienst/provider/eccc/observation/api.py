@@ -3,6 +3,7 @@
 # Distributed under the MIT License. See LICENSE for more info.
 import gzip
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from enum import Enum
 from io import BytesIO
@@ -32,10 +33,40 @@ from wetterdienst.provider.eccc.observation.metadata.resolution import (
     EccObservationResolution,
 )
 from wetterdienst.provider.eccc.observation.metadata.unit import EcccObservationUnit
-from wetterdienst.util.cache import payload_cache_twelve_hours
+from wetterdienst.util.cache import cache_dataframe, payload_cache_twelve_hours
+from wetterdienst.util.network import session
+
+try:
+    from pyarrow import csv as pa_csv
+except ImportError:  # pragma: no cover
+    pa_csv = None
 
 log = logging.getLogger(__name__)
 
+# Column names used on the per-station hot path, bound once so collecting
+# values doesn't go through the Enum descriptor on every access
+_STATION_ID = Columns.STATION_ID.value
+_DATE = Columns.DATE.value
+_PARAMETER = Columns.PARAMETER.value
+_VALUE = Columns.VALUE.value
+_QUALITY = Columns.QUALITY.value
+
+# Columns of the bulk data files that are of no interest and therefor are
+# excluded at parse time already instead of being materialized and dropped
+BULK_DATA_EXCLUDED_COLUMNS = frozenset(
+    (
+        "longitude (x)",
+        "latitude (y)",
+        "station name",
+        "climate id",
+        "year",
+        "month",
+        "day",
+        "time (lst)",
+        "data quality",
+    )
+)
+
 
 class EcccObservationValues(ScalarValuesCore):
 
@@ -77,6 +108,32 @@ class EcccObservationValues(ScalarValuesCore):
         Resolution.ANNUAL: "ANL",
     }
 
+    _datetime_format_mapping = {
+        Resolution.HOURLY: "%Y-%m-%d %H:%M",
+        Resolution.DAILY: "%Y-%m-%d",
+        Resolution.MONTHLY: "%Y-%m",
+        Resolution.ANNUAL: "%Y",
+    }
+
+    def _coerce_dates(self, series: pd.Series) -> pd.Series:
+        """
+        Use predefined datetime format of the bulk data for the requested
+        resolution to reduce processing time, instead of having pandas infer it.
+
+        :param series:
+        :return:
+        """
+        datetime_format = self._datetime_format_mapping.get(
+            self.stations.stations.resolution
+        )
+
+        try:
+            return pd.to_datetime(series, format=datetime_format).dt.tz_localize(
+                self.data_tz
+            )
+        except (TypeError, ValueError):
+            return super()._coerce_dates(series)
+
     @property
     def _time_step(self):
         """ internal time step string for resolution """
@@ -107,12 +164,12 @@ class EcccObservationValues(ScalarValuesCore):
         for parameter_column, quality_column in zip(columns[1::2], columns[2::2]):
             df_parameter = pd.DataFrame(
                 {
-                    Columns.DATE.value: df[Columns.DATE.value],
-                    Columns.VALUE.value: df[parameter_column],
-                    Columns.QUALITY.value: df[quality_column],
+                    _DATE: df[_DATE],
+                    _VALUE: df[parameter_column],
+                    _QUALITY: df[quality_column],
                 }
             )
-            df_parameter[Columns.PARAMETER.value] = parameter_column
+            df_parameter[_PARAMETER] = parameter_column
             data.append(df_parameter)
 
         try:
@@ -128,13 +185,41 @@ class EcccObservationValues(ScalarValuesCore):
         """
 
         :param station_id: station id being queried
-        :param parameter: parameter being queried
+        :param parameter: parameter being queried, can be skipped as the bulk
+            data of a station holds all parameters anyway
         :param dataset: dataset of query, can be skipped as ECCC has unique dataset
         :return: pandas.DataFrame with data
         """
-        meta = self.stations.df[
-            self.stations.df[Columns.STATION_ID.value] == station_id
-        ]
+        try:
+            df = self._station_data_cache[station_id]
+        except KeyError:
+            df = self._collect_station_data(station_id)
+            self._station_data_cache[station_id] = df
+
+        # Shallow copy so that downstream column assignments don't alter the
+        # cached frame
+        return df.copy(deep=False)
+
+    @property
+    def _station_data_cache(self) -> dict:
+        """
+        Cache of bulk data per station. As the files hold all parameters of a
+        station, collecting multiple parameters would otherwise download and
+        parse the very same files once per parameter.
+        """
+        try:
+            return self.__station_data_cache
+        except AttributeError:
+            self.__station_data_cache = {}
+            return self.__station_data_cache
+
+    def _collect_station_data(self, station_id: str) -> pd.DataFrame:
+        """
+
+        :param station_id: station id being queried
+        :return: pandas.DataFrame with data
+        """
+        meta = self.stations.df[self.stations.df[_STATION_ID] == station_id]
 
         name, from_date, to_date = (
             meta[
@@ -168,47 +253,83 @@ class EcccObservationValues(ScalarValuesCore):
 
         # check that station has a first and last year value
         if start_year and end_year:
-            for url in self._create_file_urls(station_id, start_year, end_year):
-                log.info(f"Acquiring file from {url}")
-
-                # TODO change this back to verify=True
-                payload = self._session.get(url, timeout=60)
-
-                df_temp = pd.read_csv(BytesIO(payload.content))
-
-                df_temp = df_temp.rename(columns=str.lower)
-
-                df_temp = df_temp.drop(
-                    columns=[
-                        "longitude (x)",
-                        "latitude (y)",
-                        "station name",
-                        "climate id",
-                        "year",
-                        "month",
-                        "day",
-                        "time (lst)",
-                    ],
-                    errors="ignore",
+            # Files are independent of each other, so download them concurrently
+            # to overlap the waiting time on the server. The number of workers
+            # is limited to keep the load on the public service reasonable, and
+            # parsing happens within the block so payloads are consumed as they
+            # arrive instead of being buffered until the last download is done.
+            with ThreadPoolExecutor(max_workers=16) as executor:
+                payloads = executor.map(
+                    self._download_payload,
+                    self._create_file_urls(station_id, start_year, end_year),
                 )
 
-                df = df.append(df_temp)
+                for payload in payloads:
+                    df_temp = self._read_bulk_data(payload)
+
+                    df_temp = df_temp.rename(columns=str.lower)
+
+                    df = df.append(df_temp)
 
             df = df.rename(
                 columns={
-                    "date/time (lst)": Columns.DATE.value,
-                    "date/time": Columns.DATE.value,
+                    "date/time (lst)": _DATE,
+                    "date/time": _DATE,
                 }
             )
 
             df = df.reset_index(drop=True)
 
-        df = df.drop(columns=["data quality"], errors="ignore")
-
-        df[Columns.STATION_ID.value] = station_id
+        df[_STATION_ID] = station_id
 
         return df
 
+    def _download_payload(self, url: str) -> bytes:
+        """
+        Download a single bulk data file.
+
+        :param url: url of the file
+        :return: raw CSV payload
+        """
+        log.info(f"Acquiring file from {url}")
+
+        # TODO change this back to verify=True
+        payload = self._session.get(url, timeout=60)
+
+        return payload.content
+
+    @staticmethod
+    def _read_bulk_data(payload: bytes) -> pd.DataFrame:
+        """
+        Read a bulk data CSV payload into a DataFrame. Uses pyarrow's
+        multithreaded CSV reader if it is installed and otherwise falls back
+        to the slower pandas one. Columns of no interest are filtered out at
+        parse time already so they never have to be allocated.
+
+        :param payload: raw CSV payload
+        :return: pandas.DataFrame with the parsed payload
+        """
+        if pa_csv:
+            table = pa_csv.read_csv(
+                BytesIO(payload),
+                convert_options=pa_csv.ConvertOptions(strings_can_be_null=True),
+            )
+
+            table = table.select(
+                [
+                    column
+                    for column in table.column_names
+                    if column.lower() not in BULK_DATA_EXCLUDED_COLUMNS
+                ]
+            )
+
+            return table.to_pandas()
+
+        return pd.read_csv(
+            BytesIO(payload),
+            usecols=lambda column: column.lower() not in BULK_DATA_EXCLUDED_COLUMNS,
+        )
+
     def _create_file_urls(
         self, station_id: str, start_year: int, end_year: int
     ) -> Generator[str, None, None]:
@@ -336,8 +457,25 @@ class EcccObservationRequest(ScalarRequestCore):
         )
 
     def _all(self) -> pd.DataFrame:
-        # Acquire raw CSV payload.
-        csv_payload = self._download_stations()
+        # Acquire already parsed stations data.
+        df = self._fetch_stations()
+
+        df = df.rename(columns=self._columns_mapping)
+
+        return df
+
+    @staticmethod
+    @cache_dataframe(payload_cache_twelve_hours)
+    def _fetch_stations() -> pd.DataFrame:
+        """
+        Acquire and parse the station list. The parsed DataFrame is cached so
+        that repeated calls skip both the download and the CSV parsing, which
+        otherwise dominate the cost of building the stations listing. The raw
+        CSV payload remains cached separately for the cold path.
+
+        :return: pandas.DataFrame with stations as published by ECCC
+        """
+        csv_payload = EcccObservationRequest._download_stations()
 
         # Read into Pandas data frame.
         df = pd.read_csv(BytesIO(csv_payload), header=2, dtype=str)
@@ -346,8 +484,6 @@ class EcccObservationRequest(ScalarRequestCore):
 
         df = df.drop(columns=["latitude", "longitude"])
 
-        df = df.rename(columns=self._columns_mapping)
-
         return df
 
     @staticmethod
@@ -373,19 +509,24 @@ class EcccObservationRequest(ScalarRequestCore):
         payload = None
 
         # Try original source.
-        session = FTPSession()
+        ftp_session = FTPSession()
         try:
-            response = session.retr(ftp_url)
+            response = ftp_session.retr(ftp_url)
             payload = response.content
         except Exception:
             log.exception(f"Unable to access FTP server at {ftp_url}")
 
-            # Fall back to different source.
+            # Fall back to different source. Stream the response through the
+            # shared session so the compressed payload is inflated on the fly
+            # instead of being buffered in memory a second time.
             try:
-                response = requests.get(http_url)
-                response.raise_for_status()
-                with gzip.open(BytesIO(response.content), mode="rb") as f:
-                    payload = f.read()
+                with session.get(http_url, stream=True) as response:
+                    response.raise_for_status()
+                    # Undo any transport level content encoding before the
+                    # payload reaches the gzip reader
+                    response.raw.decode_content = True
+                    with gzip.open(response.raw, mode="rb") as f:
+                        payload = f.read()
             except Exception:
                 log.exception(f"Unable to access HTTP server at {http_url}")
 
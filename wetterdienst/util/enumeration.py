@@ -2,13 +2,45 @@
 # Copyright (c) 2018-2021, earthobservations developers.
 # Distributed under the MIT License. See LICENSE for more info.
 from enum import Enum
-from typing import Optional, Type, Union
+from functools import lru_cache
+from typing import Dict, Optional, Type, Union
 
 from numpy.distutils.misc_util import as_list
 
 from wetterdienst.exceptions import InvalidEnumeration
 
 
+@lru_cache(maxsize=None)
+def _create_value_member_mapping(enumeration: Type[Enum]) -> Dict[str, Enum]:
+    """
+    Function to create a value-to-member mapping for an enumeration that allows
+    resolving members from strings with a single dict lookup instead of scanning
+    the enumeration member by member. Lowercased values are added as fallback
+    keys for case-insensitive matching. The mapping is created only once per
+    enumeration and cached afterwards.
+
+    :param enumeration:     enumeration for which the mapping is created
+    :return:                mapping of (lowercased) member value to member
+    """
+    mapping = {}
+
+    for member in enumeration:
+        if isinstance(member.value, str):
+            mapping.setdefault(member.value.lower(), member)
+
+    # Exact values take precedence over case-insensitive fallbacks. Non-string
+    # values are included as well as long as they are hashable, so that members
+    # can also be resolved from e.g. plain integers without falling back to the
+    # slower Enum call.
+    for member in enumeration:
+        try:
+            mapping[member.value] = member
+        except TypeError:
+            pass
+
+    return mapping
+
+
 def parse_enumeration_from_template(
     enum_: Union[str, Enum], intermediate: Type[Enum], base: Optional[Type[Enum]] = None
 ) -> Optional[Enum]:
@@ -37,25 +69,34 @@ def parse_enumeration_from_template(
         except AttributeError:
             pass
 
-    try:
-        enum_parsed = intermediate[enum_name.upper()]
-    except (KeyError, AttributeError):
-        try:
-            if isinstance(enum_, str):
-                candidates = [enum_, enum_.lower()]
-                success = False
-                for candidate in candidates:
-                    try:
-                        enum_parsed = intermediate(candidate)
-                        success = True
-                        break
-                    except ValueError:
-                        pass
-                if not success:
-                    raise ValueError()
-            else:
-                enum_parsed = intermediate(enum_)
-        except ValueError:
+    enum_parsed = None
+
+    # Member names are stored upper case, so resolving a name is one hashed
+    # dict lookup.
+    if enum_name is not None:
+        enum_parsed = intermediate.__members__.get(enum_name.upper())
+
+    if enum_parsed is None:
+        value_member_mapping = _create_value_member_mapping(intermediate)
+
+        if isinstance(enum_, str):
+            enum_parsed = value_member_mapping.get(enum_)
+
+            if enum_parsed is None:
+                enum_parsed = value_member_mapping.get(enum_.lower())
+        else:
+            try:
+                enum_parsed = value_member_mapping.get(enum_)
+            except TypeError:
+                pass
+
+            if enum_parsed is None:
+                try:
+                    enum_parsed = intermediate(enum_)
+                except ValueError:
+                    pass
+
+        if enum_parsed is None:
             raise InvalidEnumeration(
                 f"{enum_} could not be parsed from {intermediate.__name__}."
             )
@@ -64,13 +105,15 @@ def parse_enumeration_from_template(
         try:
             enum_parsed = base[enum_parsed.name]
         except (KeyError, AttributeError):
-            try:
-                enum_parsed = base(enum_parsed)
-            except ValueError:
+            base_parsed = _create_value_member_mapping(base).get(enum_parsed)
+
+            if base_parsed is None:
                 raise InvalidEnumeration(
                     f"{enum_parsed} could not be parsed from {base.__name__}."
                 )
 
+            enum_parsed = base_parsed
+
     return enum_parsed
 
 
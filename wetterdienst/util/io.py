@@ -1,12 +1,29 @@
-def read_in_chunks(file_object, chunk_size=1024):
+def read_in_chunks(file_object, chunk_size=1024 * 1024):
     """
     Lazy function (generator) to read a file piece by piece.
-    Default chunk size: 1k.
+    Default chunk size: 1 MiB.
+
+    Where the file object supports it, chunks are read into a preallocated
+    buffer so each iteration costs one read call instead of allocating a
+    fresh bytes object of chunk size.
 
     -- https://stackoverflow.com/questions/519633/lazy-method-for-reading-big-file-in-python/519653#519653  # Noqa: E501, B950
     """
+    readinto = getattr(file_object, "readinto", None)
+
+    if readinto is None:
+        while True:
+            data = file_object.read(chunk_size)
+            if not data:
+                break
+            yield data
+        return
+
+    buffer = bytearray(chunk_size)
+    view = memoryview(buffer)
+
     while True:
-        data = file_object.read(chunk_size)
-        if not data:
+        number_of_bytes = readinto(buffer)
+        if not number_of_bytes:
             break
-        yield data
+        yield bytes(view[:number_of_bytes])